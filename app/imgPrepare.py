@@ -14,6 +14,7 @@ import argparse
 import gc
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -362,42 +363,12 @@ def process_folder_iter(config):
         # Generator returns final counts (access via StopIteration.value or wrapper)
     """
     # Collect files first to know total count
-    files_to_process = []
-    for root, _, files in os.walk(config.input_dir):
-        root_path = Path(root)
-        rel_path = root_path.relative_to(config.input_dir)
-
-        if config.flatten:
-            target_dir = config.output_dir
-            prefix = "" if rel_path == Path(".") else str(rel_path).replace(os.sep, " - ")
-        else:
-            target_dir = config.output_dir / rel_path
-            prefix = ""
-
-        for filename in files:
-            if is_image_file(filename):
-                files_to_process.append((root_path / filename, target_dir, prefix))
-
+    files_to_process = collect_files(config)
     total = len(files_to_process)
     counts = {"processed": 0, "exists": 0, "error": 0}
 
     for i, (filepath, target_dir, prefix) in enumerate(files_to_process, 1):
-        status, out_path, error_msg = process_image(
-            filepath,
-            target_dir,
-            prefix,
-            config.mode,
-            config.target_size,
-            config.pad_mode,
-            config.crop_min,
-            config.stretch_max,
-            config.no_stretch_limit,
-            config.show_text,
-            config.skip_existing,
-            config.dry_run,
-            config.verbose,
-            config.quiet,
-        )
+        status, out_path, error_msg = _process_entry(config, filepath, target_dir, prefix)
         counts[status] = counts.get(status, 0) + 1
 
         yield PrepareProgress(
@@ -418,6 +389,121 @@ def process_folder_iter(config):
     return counts
 
 
+def process_folder_parallel(config, workers=None):
+    """
+    Like process_folder_iter, but processes several images at once.
+
+    PIL releases the GIL while decoding, resizing and encoding, so worker
+    threads use multiple cores without the memory cost of extra processes.
+    At most 2 * workers groups are queued at a time; each one in progress
+    holds a decoded full-size image, so keep workers low on small boards.
+
+    Files that end up at the same output (e.g. IMG_1.heic and IMG_1.png)
+    form one group and run one after another on the same worker, so the
+    JPG conversion and skip_existing see each other's results.
+
+    Progress is yielded in completion order with increasing `current`.
+    Closing the generator early (cancellation) drops images not yet started.
+    """
+    workers = workers or min(4, os.cpu_count() or 1)
+    files_to_process = collect_files(config)
+    total = len(files_to_process)
+    counts = {"processed": 0, "exists": 0, "error": 0}
+
+    groups = {}
+    for entry in files_to_process:
+        groups.setdefault(_output_key(*entry), []).append(entry)
+
+    pending = set()
+    remaining = iter(groups.values())
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="imgPrepare")
+    try:
+        current = 0
+        while True:
+            for group in remaining:
+                pending.add(executor.submit(_process_group, config, group))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for filepath, (status, out_path, error_msg) in future.result():
+                    counts[status] = counts.get(status, 0) + 1
+                    current += 1
+
+                    yield PrepareProgress(
+                        current=current,
+                        total=total,
+                        filepath=str(filepath),
+                        output_path=str(out_path),
+                        status=status,
+                        error_message=error_msg,
+                    )
+
+                    # Force garbage collection every 10 images to keep memory in check
+                    if current % 10 == 0:
+                        gc.collect()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    # Final cleanup
+    gc.collect()
+    return counts
+
+
+def collect_files(config):
+    """List (filepath, target_dir, prefix) for every image below config.input_dir."""
+    files_to_process = []
+    for root, _, files in os.walk(config.input_dir):
+        root_path = Path(root)
+        rel_path = root_path.relative_to(config.input_dir)
+
+        if config.flatten:
+            target_dir = config.output_dir
+            prefix = "" if rel_path == Path(".") else str(rel_path).replace(os.sep, " - ")
+        else:
+            target_dir = config.output_dir / rel_path
+            prefix = ""
+
+        for filename in files:
+            if is_image_file(filename):
+                files_to_process.append((root_path / filename, target_dir, prefix))
+    return files_to_process
+
+
+def _output_key(filepath, target_dir, prefix):
+    """Output path process_image writes for a collected file."""
+    name = Path(filepath).stem
+    return target_dir / (f"{prefix} - {name}.jpg" if prefix else f"{name}.jpg")
+
+
+def _process_group(config, group):
+    """Process entries sharing one output in order; list (filepath, result)."""
+    return [(entry[0], _process_entry(config, *entry)) for entry in group]
+
+
+def _process_entry(config, filepath, target_dir, prefix):
+    """Run process_image for one collected file with the settings from config."""
+    return process_image(
+        filepath,
+        target_dir,
+        prefix,
+        config.mode,
+        config.target_size,
+        config.pad_mode,
+        config.crop_min,
+        config.stretch_max,
+        config.no_stretch_limit,
+        config.show_text,
+        config.skip_existing,
+        config.dry_run,
+        config.verbose,
+        config.quiet,
+    )
+
+
 def process_folder(
     input_dir,
     output_dir,
@@ -8,6 +8,9 @@ Provides different backends for controlling monitor/TV power:
 - Samsung WS: Samsung Smart TV WebSocket API
 """
 
+import http.client
+import importlib
+import threading
 from abc import ABC, abstractmethod
 
 
@@ -55,27 +58,72 @@ class NullMonitorControl(MonitorControlProvider):
         return True
 
 
-# Import providers AFTER base class is defined to avoid circular imports
-from .cec import CECMonitorControl
-from .shelly import ShellyMonitorControl
-from .gpio import GPIORelayMonitorControl
-from .samsung import SamsungWSMonitorControl
+class KeepAliveHTTP:
+    """
+    Plain HTTP GET requests to a LAN device over one reused connection.
+
+    Saves the TCP handshake per request for providers that talk to the same
+    device repeatedly. Thread-safe.
+    """
+
+    def __init__(self, host, port=None, timeout=5):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """GET path, returning (status, body). Raises OSError or HTTPException on failure."""
+        with self._lock:
+            # The device may have dropped an idle kept-alive connection; in that
+            # case retry once on a fresh one
+            attempts = 2 if self._conn is not None else 1
+            for attempt in range(attempts):
+                if self._conn is None:
+                    self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+                try:
+                    self._conn.request("GET", path)
+                    response = self._conn.getresponse()
+                    return response.status, response.read()
+                except (http.client.HTTPException, OSError) as e:
+                    self._conn.close()
+                    self._conn = None
+                    if attempt == attempts - 1 or isinstance(e, TimeoutError):
+                        raise
+
+
+# Provider name (also its config section) -> (module, class name).
+# Modules are imported on demand, so only the configured provider is loaded.
+_PROVIDERS = {
+    "cec": (".cec", "CECMonitorControl"),
+    "shelly": (".shelly", "ShellyMonitorControl"),
+    "gpio_relay": (".gpio", "GPIORelayMonitorControl"),
+    "samsung_ws": (".samsung", "SamsungWSMonitorControl"),
+}
+_PROVIDER_MODULES = {class_name: module for module, class_name in _PROVIDERS.values()}
+
+
+def _load_provider_class(module, class_name):
+    return getattr(importlib.import_module(module, __name__), class_name)
+
+
+def __getattr__(name):
+    """Import provider classes on first access (from monitor import CECMonitorControl)."""
+    module = _PROVIDER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_provider_class(module, name)
 
 
 def create_monitor_control(config) -> MonitorControlProvider:
     """Factory function to create the configured monitor control provider."""
     provider = config.get("provider", "none")
 
-    if provider == "cec":
-        return CECMonitorControl(config.get("cec", {}))
-    elif provider == "shelly":
-        return ShellyMonitorControl(config.get("shelly", {}))
-    elif provider == "gpio_relay":
-        return GPIORelayMonitorControl(config.get("gpio_relay", {}))
-    elif provider == "samsung_ws":
-        return SamsungWSMonitorControl(config.get("samsung_ws", {}))
-    else:
+    entry = _PROVIDERS.get(provider)
+    if entry is None:
         return NullMonitorControl()
+    return _load_provider_class(*entry)(config.get(provider, {}))
 
 
 __all__ = [
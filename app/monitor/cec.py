@@ -11,7 +11,9 @@ Limitations:
 - May not work reliably with all HDMI switches
 """
 
+import atexit
 import subprocess
+import threading
 
 from aide_frame.log import logger
 from . import MonitorControlProvider
@@ -23,15 +25,50 @@ class CECMonitorControl(MonitorControlProvider):
     def __init__(self, config):
         super().__init__()
         self.device_id = config.get("device_id", "0")
+        # One long-lived cec-client; starting it (and libcec) per command takes
+        # a noticeable fraction of a second on a Pi
+        self._proc = None
+        self._lock = threading.Lock()
+        atexit.register(self._close)
+
+    def _spawn(self):
+        """Start cec-client in interactive mode, reading commands from stdin."""
+        return subprocess.Popen(
+            ["cec-client", "-d", "1"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+
+    def _send(self, command):
+        """Send a command to cec-client, restarting it if it has exited."""
+        line = f"{command} {self.device_id}\n".encode()
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = self._spawn()
+            try:
+                self._proc.stdin.write(line)
+            except BrokenPipeError:
+                # Died between poll() and write: retry once with a fresh process
+                self._proc = self._spawn()
+                self._proc.stdin.write(line)
+
+    def _close(self):
+        """Stop the cec-client process (registered with atexit)."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
 
     def turn_on(self) -> bool:
         try:
-            subprocess.run(
-                ["cec-client", "-s", "-d", "1"],
-                input=f"on {self.device_id}".encode(),
-                timeout=5,
-                capture_output=True
-            )
+            self._send("on")
             self._is_on = True
             logger.info("CEC: Monitor turned ON")
             return True
@@ -41,12 +78,7 @@ class CECMonitorControl(MonitorControlProvider):
 
     def turn_off(self) -> bool:
         try:
-            subprocess.run(
-                ["cec-client", "-s", "-d", "1"],
-                input=f"standby {self.device_id}".encode(),
-                timeout=5,
-                capture_output=True
-            )
+            self._send("standby")
             self._is_on = False
             logger.info("CEC: Monitor turned OFF")
             return True
@@ -25,10 +25,19 @@ Setup for Samsung The Frame:
 3. Token is saved to token_file for future connections
 """
 
+import http.client
+import json
+import socket
+import threading
 import time
+import urllib.request
 
 from aide_frame.log import logger
-from . import MonitorControlProvider
+from . import MonitorControlProvider, KeepAliveHTTP
+
+
+# Separators accepted in MAC addresses (aa:bb:cc:dd:ee:ff or aa-bb-cc-dd-ee-ff)
+_MAC_SEPARATORS = str.maketrans('', '', ':-')
 
 
 class SamsungWSMonitorControl(MonitorControlProvider):
@@ -42,13 +51,30 @@ class SamsungWSMonitorControl(MonitorControlProvider):
         self.port = config.get("port", 8002)  # 8001 for older TVs, 8002 for newer (SSL)
         self.timeout = config.get("timeout", 5)
         self.name = config.get("name", "RaspberryPiSlideshow")
-        self._tv = None
+        self._tv = None  # Kept WebSocket connection, guarded by _tv_lock
+        self._tv_lock = threading.Lock()
+        self._tv_used = 0.0  # Monotonic time of the last successful send
         self._tv_class = None
+        self._rest = None
+        self._available = (0.0, False)  # (monotonic time of probe, result)
+        self._magic_packet = None
+        self._wol_sock = None
+
+        # The MAC never changes, so build the Wake-on-LAN packet once
+        if self.mac_address:
+            try:
+                mac_bytes = bytes.fromhex(self.mac_address.translate(_MAC_SEPARATORS))
+                self._magic_packet = b'\xff' * 6 + mac_bytes * 16
+            except ValueError:
+                logger.error(f"Samsung WS: Invalid MAC address: {self.mac_address}")
 
         if not self.ip:
             logger.warning("Samsung TV IP not configured")
             return
 
+        # Availability is probed on every turn_on/turn_off, keep that connection open
+        self._rest = KeepAliveHTTP(self.ip, 8001, timeout=2)
+
         # Import the library
         try:
             from samsungtvws import SamsungTVWS
@@ -69,7 +95,7 @@ class SamsungWSMonitorControl(MonitorControlProvider):
             logger.error(f"Samsung WS init error: {e}")
 
     def _get_connection(self):
-        """Create a new TV connection (connections should be short-lived)."""
+        """Create a new TV connection object (it connects on first use)."""
         if not self._tv_class:
             return None
         try:
@@ -84,48 +110,80 @@ class SamsungWSMonitorControl(MonitorControlProvider):
             logger.error(f"Samsung WS connection error: {e}")
             return None
 
+    # Back-to-back motion events reuse the last probe result for this long (seconds)
+    AVAILABLE_TTL = 1.0
+
     def _check_tv_available(self) -> bool:
+        """Check if TV is reachable, reusing a probe younger than AVAILABLE_TTL."""
+        probed_at, available = self._available
+        now = time.monotonic()
+        if now - probed_at < self.AVAILABLE_TTL:
+            return available
+        available = self._probe_tv()
+        self._available = (now, available)
+        return available
+
+    def _probe_tv(self) -> bool:
         """Check if TV is reachable via REST API (works even without WebSocket)."""
-        import urllib.request
-        import urllib.error
+        if not self._rest:
+            return False
         try:
             # Samsung TVs expose device info via REST
-            url = f"http://{self.ip}:8001/api/v2/"
-            req = urllib.request.Request(url, method='GET')
-            with urllib.request.urlopen(req, timeout=2) as response:
-                return response.status == 200
-        except (urllib.error.URLError, TimeoutError, OSError):
+            status, _ = self._rest.get("/api/v2/")
+            return status == 200
+        except (http.client.HTTPException, OSError):
             return False
 
+    # A kept connection idle for longer than this (seconds) is reopened before
+    # use; the TV drops idle WebSockets and a stale one would fail the send
+    CONNECTION_IDLE_TIMEOUT = 60
+
     def _send_key(self, key):
-        """Send a key command to the TV."""
-        tv = self._get_connection()
-        if not tv:
+        """Send a key command to the TV, reusing the connection of previous sends."""
+        with self._tv_lock:
+            if self._tv is not None and time.monotonic() - self._tv_used > self.CONNECTION_IDLE_TIMEOUT:
+                self._close_connection()
+
+            # A kept connection may have gone stale anyway; retry once on a new one
+            attempts = 2 if self._tv is not None else 1
+            for attempt in range(attempts):
+                if self._tv is None:
+                    self._tv = self._get_connection()
+                    if not self._tv:
+                        return False
+                # The key may change the TV's power state, so the next check must probe again
+                self._available = (0.0, False)
+                try:
+                    self._tv.send_key(key)
+                    self._tv_used = time.monotonic()
+                    return True
+                except Exception as e:
+                    self._close_connection()
+                    if attempt == attempts - 1:
+                        logger.error(f"Samsung WS send_key error: {e}")
             return False
+
+    def _close_connection(self):
+        """Close the kept TV connection. Caller must hold self._tv_lock."""
+        tv, self._tv = self._tv, None
         try:
-            tv.send_key(key)
-            return True
-        except Exception as e:
-            logger.error(f"Samsung WS send_key error: {e}")
-            return False
+            tv.close()
+        except Exception:
+            pass
 
     def _wake_on_lan(self) -> bool:
         """Wake TV via Wake-on-LAN if MAC address is configured."""
-        if not self.mac_address:
+        if not self._magic_packet:
             logger.debug("Samsung WS: MAC address not configured for Wake-on-LAN")
             return False
 
         try:
-            # Build magic packet
-            mac_bytes = bytes.fromhex(self.mac_address.replace(':', '').replace('-', ''))
-            magic_packet = b'\xff' * 6 + mac_bytes * 16
-
-            # Send via UDP broadcast
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.sendto(magic_packet, ('255.255.255.255', 9))
-            sock.close()
+            # Send via UDP broadcast, keeping the socket for the next wake-up
+            if self._wol_sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                self._wol_sock = sock
+            self._wol_sock.sendto(self._magic_packet, ('255.255.255.255', 9))
 
             logger.debug("Samsung WS: Wake-on-LAN packet sent")
             return True
@@ -140,10 +198,11 @@ class SamsungWSMonitorControl(MonitorControlProvider):
             return True
 
         # Try Wake-on-LAN first (works when TV is in standby)
-        if self.mac_address:
+        if self._magic_packet:
             self._wake_on_lan()
             # Wait a moment for TV to wake
             time.sleep(3)
+            self._available = (0.0, False)
 
         # Check if TV is now available
         if self._check_tv_available():
@@ -167,18 +226,13 @@ class SamsungWSMonitorControl(MonitorControlProvider):
             logger.debug("Samsung WS: TV already off")
             return True
 
-        # Send power key to put TV in standby
+        # Send power key to put TV in standby. _send_key only fails when the
+        # connection fails, so trying another key would just fail again.
         if self._send_key("KEY_POWER"):
             self._is_on = False
             logger.info("Samsung WS: Monitor turned OFF")
             return True
 
-        # Alternative: try KEY_POWEROFF specifically
-        if self._send_key("KEY_POWEROFF"):
-            self._is_on = False
-            logger.info("Samsung WS: Monitor turned OFF via KEY_POWEROFF")
-            return True
-
         logger.error("Samsung WS: Failed to turn off TV")
         return False
 
@@ -200,8 +254,6 @@ class SamsungWSMonitorControl(MonitorControlProvider):
 
     def get_device_info(self) -> dict:
         """Get TV device information via REST API."""
-        import urllib.request
-        import json
         try:
             url = f"http://{self.ip}:8001/api/v2/"
             with urllib.request.urlopen(url, timeout=5) as response:
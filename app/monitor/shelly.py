@@ -16,7 +16,7 @@ Limitations:
 """
 
 from aide_frame.log import logger
-from . import MonitorControlProvider
+from . import MonitorControlProvider, KeepAliveHTTP
 
 
 class ShellyMonitorControl(MonitorControlProvider):
@@ -25,16 +25,18 @@ class ShellyMonitorControl(MonitorControlProvider):
     def __init__(self, config):
         super().__init__()
         self.ip = config.get("ip")
+        self._http = KeepAliveHTTP(self.ip, timeout=5) if self.ip else None
 
         if not self.ip:
             logger.warning("Shelly IP not configured")
 
     def _request(self, action):
         """Send request to Shelly device."""
-        import urllib.request
         try:
-            url = f"http://{self.ip}/relay/0?turn={action}"
-            urllib.request.urlopen(url, timeout=5)
+            status, _ = self._http.get(f"/relay/0?turn={action}")
+            if status >= 400:
+                logger.error(f"Shelly error: HTTP {status}")
+                return False
             return True
         except Exception as e:
             logger.error(f"Shelly error: {e}")
@@ -13,6 +13,12 @@ from abc import ABC, abstractmethod
 from aide_frame.log import logger
 
 
+# MQTT payloads that signal motion (common sensor / Zigbee2MQTT formats)
+_MOTION_TRUE = frozenset(("ON", "on", "On", "1", "true", "True", "TRUE", "motion", "detected"))
+# First bytes of those payloads, to drop most other messages without decoding them
+_MOTION_FIRST_BYTES = frozenset(p.encode()[0] for p in _MOTION_TRUE)
+
+
 class MotionSensorProvider(ABC):
     """
     Abstract interface for motion detection.
@@ -80,15 +86,23 @@ class GPIOPIRMotionSensor(MotionSensorProvider):
     - Can be triggered by pets
     """
 
+    # Recheck interval while the pin is high; a falling edge inside the
+    # bouncetime is dropped by RPi.GPIO and would otherwise never wake us
+    ACTIVE_RECHECK = 5.0
+
     def __init__(self, config, on_motion_callback, on_idle_callback):
         super().__init__(on_motion_callback, on_idle_callback)
         self.pin = config.get("pin", 17)
         self.idle_timeout = config.get("idle_timeout", 300)
         self._running = False
         self._thread = None
-        self._last_motion = time.time()
+        # Monotonic time at which no-motion turns into idle; moved on every falling edge
+        self._idle_deadline = time.monotonic() + self.idle_timeout
         self._gpio_available = False
         self._was_idle = False
+        self._motion_active = False  # Pin was high at the last check
+        self._edge = threading.Event()  # Set by the GPIO edge callback and by stop()
+        self._poll_interval = None  # Only used if edge detection is unavailable
 
     def start(self):
         try:
@@ -96,6 +110,14 @@ class GPIOPIRMotionSensor(MotionSensorProvider):
             self.GPIO = GPIO
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.pin, GPIO.IN)
+            try:
+                # Wake the monitor thread on pin changes instead of polling it
+                GPIO.add_event_detect(self.pin, GPIO.BOTH,
+                                      callback=lambda channel: self._edge.set(),
+                                      bouncetime=200)
+            except RuntimeError as e:
+                logger.warning(f"PIR: Edge detection unavailable ({e}), polling instead")
+                self._poll_interval = 0.5
             self._gpio_available = True
             self._running = True
             self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
@@ -108,26 +130,45 @@ class GPIOPIRMotionSensor(MotionSensorProvider):
 
     def stop(self):
         self._running = False
+        self._edge.set()
+        if self._gpio_available:
+            try:
+                self.GPIO.remove_event_detect(self.pin)
+            except Exception:
+                pass
 
     def _monitor_loop(self):
         while self._running:
+            # Clear before reading the pin so an edge during the check is not lost
+            self._edge.clear()
+            timeout = self._poll_interval
             try:
                 if self.GPIO.input(self.pin):
-                    self._last_motion = time.time()
+                    self._motion_active = True
+                    timeout = self.ACTIVE_RECHECK if timeout is None else min(timeout, self.ACTIVE_RECHECK)
                     if self._was_idle:
                         self._was_idle = False
                         logger.info("PIR: Motion detected")
                         self.on_motion()
                 else:
-                    idle_time = time.time() - self._last_motion
-                    if idle_time > self.idle_timeout and not self._was_idle:
+                    now = time.monotonic()
+                    if self._motion_active:
+                        # Falling edge: the idle period starts now, not at the rising edge
+                        self._motion_active = False
+                        self._idle_deadline = now + self.idle_timeout
+                    remaining = self._idle_deadline - now
+                    if remaining <= 0 and not self._was_idle:
                         self._was_idle = True
                         logger.info(f"PIR: No motion for {self.idle_timeout}s")
                         self.on_idle()
+                    elif not self._was_idle:
+                        # Sleep until the idle deadline unless an edge comes first
+                        timeout = remaining if timeout is None else min(timeout, remaining)
             except Exception as e:
                 logger.error(f"PIR error: {e}")
+                timeout = 0.5
 
-            time.sleep(0.5)
+            self._edge.wait(timeout)
 
 
 class MQTTMotionSensor(MotionSensorProvider):
@@ -183,32 +224,42 @@ class MQTTMotionSensor(MotionSensorProvider):
             self._client.disconnect()
 
     def _on_message(self, client, userdata, message):
+        raw = message.payload
+        if not raw or (raw[0] not in _MOTION_FIRST_BYTES and not raw[:1].isspace()):
+            return
+
+        # Tolerate surrounding whitespace and stray non-ASCII bytes after the
+        # payload from simple publishers (the first byte must still match)
+        payload = raw.decode('ascii', 'ignore').strip()
+        if payload not in _MOTION_TRUE:
+            return
+
+        logger.info(f"MQTT: Motion detected on {message.topic}")
         try:
-            payload = message.payload.decode()
-            # Handle common motion sensor payload formats
-            if payload in ("ON", "on", "1", "true", "motion"):
-                logger.info(f"MQTT: Motion detected on {message.topic}")
-                self.on_motion()
+            self.on_motion()
         except Exception as e:
             logger.error(f"MQTT message error: {e}")
 
 
+# Provider name (also its config section) -> provider class
+_PROVIDERS = {
+    "gpio_pir": GPIOPIRMotionSensor,
+    "mqtt": MQTTMotionSensor,
+}
+
+
 def create_motion_sensor(config, on_motion, on_idle) -> MotionSensorProvider:
     """Factory function to create the configured motion sensor provider."""
     provider = config.get("provider", "none")
-    idle_timeout = config.get("idle_timeout", 300)
-
-    if provider == "gpio_pir":
-        sensor_config = config.get("gpio_pir", {})
-        sensor_config["idle_timeout"] = idle_timeout
-        return GPIOPIRMotionSensor(sensor_config, on_motion, on_idle)
-    elif provider == "mqtt":
-        sensor_config = config.get("mqtt", {})
-        sensor_config["idle_timeout"] = idle_timeout
-        return MQTTMotionSensor(sensor_config, on_motion, on_idle)
-    else:
+
+    sensor_class = _PROVIDERS.get(provider)
+    if sensor_class is None:
         return NullMotionSensor(on_motion, on_idle)
 
+    sensor_config = config.get(provider, {})
+    sensor_config["idle_timeout"] = config.get("idle_timeout", 300)
+    return sensor_class(sensor_config, on_motion, on_idle)
+
 
 __all__ = [
     'MotionSensorProvider',
@@ -26,6 +26,29 @@ class RemoteControlProvider(ABC):
 
     def __init__(self, slideshow):
         self.slideshow = slideshow
+        # Action name -> handler taking the params dict
+        self._actions = {
+            "toggle_pause": self._toggle_pause,
+            "pause": lambda params: slideshow.pause(),
+            "resume": lambda params: slideshow.resume(),
+            "skip": lambda params: slideshow.skip(),
+            "speed_up": self._speed_up,
+            "speed_down": self._speed_down,
+            "set_duration": self._set_duration,
+            "toggle_monitor": self._toggle_monitor,
+            "monitor_on": lambda params: slideshow.monitor.turn_on(),
+            "monitor_off": lambda params: slideshow.monitor.turn_off(),
+            "filter_clear": lambda params: slideshow.clear_filter(),
+            "set_filter": self._set_filter,
+            "set_orientation": self._set_orientation,
+        }
+
+        # Folder shortcuts (filter_1, ...) are fixed in the config, so resolve them once
+        shortcuts = (slideshow.config.get("remote_control", {})
+                     .get("ir_remote", {}).get("folder_shortcuts") or {})
+        for name, folder in shortcuts.items():
+            if folder and name not in self._actions:
+                self._actions[name] = lambda params, folder=folder: slideshow.set_filter(folder)
 
     @abstractmethod
     def start(self):
@@ -41,66 +64,45 @@ class RemoteControlProvider(ABC):
         """Execute a slideshow control action."""
         params = params or {}
 
-        if action == "toggle_pause":
-            if self.slideshow.paused:
-                self.slideshow.resume()
-            else:
-                self.slideshow.pause()
-
-        elif action == "pause":
-            self.slideshow.pause()
+        handler = self._actions.get(action)
+        if handler:
+            handler(params)
+        else:
+            logger.warning(f"Unknown action: {action}")
 
-        elif action == "resume":
+    def _toggle_pause(self, params):
+        if self.slideshow.paused:
             self.slideshow.resume()
+        else:
+            self.slideshow.pause()
 
-        elif action == "skip":
-            self.slideshow.skip()
-
-        elif action == "speed_up":
-            new_duration = max(5, self.slideshow.display_duration - 5)
-            self.slideshow.set_duration(new_duration)
-
-        elif action == "speed_down":
-            new_duration = min(120, self.slideshow.display_duration + 5)
-            self.slideshow.set_duration(new_duration)
+    def _speed_up(self, params):
+        new_duration = max(5, self.slideshow.display_duration - 5)
+        self.slideshow.set_duration(new_duration)
 
-        elif action == "set_duration":
-            seconds = params.get("seconds", 35)
-            self.slideshow.set_duration(seconds)
+    def _speed_down(self, params):
+        new_duration = min(120, self.slideshow.display_duration + 5)
+        self.slideshow.set_duration(new_duration)
 
-        elif action == "toggle_monitor":
-            if self.slideshow.monitor.is_on:
-                self.slideshow.monitor.turn_off()
-            else:
-                self.slideshow.monitor.turn_on()
+    def _set_duration(self, params):
+        seconds = params.get("seconds", 35)
+        self.slideshow.set_duration(seconds)
 
-        elif action == "monitor_on":
-            self.slideshow.monitor.turn_on()
-
-        elif action == "monitor_off":
+    def _toggle_monitor(self, params):
+        if self.slideshow.monitor.is_on:
             self.slideshow.monitor.turn_off()
+        else:
+            self.slideshow.monitor.turn_on()
 
-        elif action == "filter_clear":
-            self.slideshow.clear_filter()
-
-        elif action == "set_filter":
-            folder = params.get("folder")
-            if folder:
-                self.slideshow.set_filter(folder)
-
-        elif action == "set_orientation":
-            mode = params.get("mode")
-            if mode:
-                self.slideshow.set_orientation(mode)
-
-        elif action.startswith("filter_"):
-            # Handle numbered filter shortcuts
-            folder = params.get(action)
-            if folder:
-                self.slideshow.set_filter(folder)
+    def _set_filter(self, params):
+        folder = params.get("folder")
+        if folder:
+            self.slideshow.set_filter(folder)
 
-        else:
-            logger.warning(f"Unknown action: {action}")
+    def _set_orientation(self, params):
+        mode = params.get("mode")
+        if mode:
+            self.slideshow.set_orientation(mode)
 
 
 # Import providers after base class is defined
@@ -17,161 +17,268 @@ Endpoints:
 """
 
 import os
+import socket
 import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 
 from aide_frame import paths, http_routes
 from aide_frame.http_server import HttpServer, JsonHandler, get_server_url, restart_server
 from aide_frame.log import logger
+from aide_frame.paths import resolve_safe_path, PathSecurityError
+from utils.helpers import get_imgPrepare
 from . import RemoteControlProvider
 
 
-# Module-level references (set by HTTPAPIRemoteControl)
-_controller = None
-_prepare_job = None
+_ORIENTATION_MODES = frozenset(('auto', 'landscape', 'portrait_left', 'portrait_right'))
+
+# /folders results per image directory: dir -> (root mtime_ns, expires_at, response).
+# The root mtime only covers its direct children, so deeper changes rely on the TTL.
+# Least recently used entries are dropped beyond FOLDERS_CACHE_SIZE directories.
+_folders_cache = OrderedDict()
+_folders_cache_lock = threading.Lock()
+FOLDERS_CACHE_SIZE = 16
+FOLDERS_CACHE_TTL = 30  # seconds
+
+# /api/prepare/count results, same scheme: dir -> (root mtime_ns, expires_at, count).
+# Least recently used entries are dropped beyond COUNT_CACHE_SIZE directories.
+_count_cache = OrderedDict()
+_count_cache_lock = threading.Lock()
+COUNT_CACHE_SIZE = 16
+COUNT_CACHE_TTL = 30  # seconds
+
+
+def _iter_subdirs(root, path=None):
+    """Yield every directory below root as a path relative to root.
+
+    DirEntry carries the file type from the directory listing, so unlike
+    os.walk no per-entry stat is needed. Symlinks are not followed.
+    """
+    try:
+        with os.scandir(path or root) as it:
+            subdirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield os.path.relpath(subdir, root)
+        yield from _iter_subdirs(root, subdir)
+
+
+def _cached_count(directory, count_files):
+    """Return count_files() for directory, reusing a recent result for unchanged roots."""
+    try:
+        root_mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        root_mtime = None
+    now = time.monotonic()
+
+    with _count_cache_lock:
+        cached = _count_cache.get(directory)
+        if cached and cached[0] == root_mtime and now < cached[1]:
+            _count_cache.move_to_end(directory)
+            return cached[2]
+
+    count = count_files()
+    with _count_cache_lock:
+        _count_cache[directory] = (root_mtime, now + COUNT_CACHE_TTL, count)
+        _count_cache.move_to_end(directory)
+        while len(_count_cache) > COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+    return count
 
 
 class SlideshowHandler(JsonHandler):
     """HTTP handler for slideshow control API."""
 
+    # Shared references, set by HTTPAPIRemoteControl
+    controller = None
+    prepare_job = None
+
+    # Small JSON replies (status polling) must not wait for Nagle's algorithm
+    disable_nagle_algorithm = True
+
+    # Buffer the response so status line, headers and body leave in one send;
+    # BaseHTTPRequestHandler flushes wfile once after each request
+    wbufsize = 8192
+
+    def setup(self):
+        super().setup()
+        # Detect dead clients (phone went to sleep) instead of keeping the socket forever
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    # GET path -> handler method name; anything else gets the API help
+    ROUTES = {
+        '/': '_get_index',
+        '/index.html': '_get_index',
+        '/status': '_get_status',
+        '/pause': '_get_pause',
+        '/resume': '_get_resume',
+        '/skip': '_get_skip',
+        '/duration': '_get_duration',
+        '/filter': '_get_filter',
+        '/filter/clear': '_get_filter_clear',
+        '/monitor/on': '_get_monitor_on',
+        '/monitor/off': '_get_monitor_off',
+        '/orientation': '_get_orientation',
+        '/restart': '_get_restart',
+        '/folders': '_list_folders',
+        # Image preparation endpoints
+        '/prepare': '_get_prepare',
+        '/prepare.html': '_get_prepare',
+        '/api/prepare/status': '_get_prepare_status',
+        '/api/prepare/cancel': '_get_prepare_cancel',
+        '/api/prepare/count': '_handle_prepare_count',
+        '/api/prepare/defaults': '_get_prepare_defaults',
+    }
+
+    POST_ROUTES = {
+        '/api/prepare/start': '_handle_prepare_start',
+    }
+
+    API_HELP = {
+        "endpoints": [
+            "GET /status - Current status",
+            "GET /pause - Pause slideshow",
+            "GET /resume - Resume slideshow",
+            "GET /skip - Skip to next image",
+            "GET /duration?seconds=N - Set display duration",
+            "GET /filter?folder=NAME - Show only images from folder",
+            "GET /filter/clear - Clear folder filter",
+            "GET /orientation?mode=MODE - Set orientation (auto, landscape, portrait_left, portrait_right)",
+            "GET /folders - List available folders",
+            "GET /monitor/on - Turn monitor on",
+            "GET /monitor/off - Turn monitor off",
+            "GET /prepare - Image preparation UI",
+            "GET /api/prepare/status - Preparation job status",
+            "POST /api/prepare/start - Start preparation job",
+            "GET /api/prepare/cancel - Cancel running job",
+            "GET /api/update/status - Update system status",
+            "POST /api/update/check - Check for updates on GitHub",
+            "POST /api/update/download - Download and stage update",
+            "POST /api/update/apply - Apply staged update and restart",
+            "POST /api/update/rollback - Rollback to backup version",
+            "POST /api/update/enable - Re-enable updates after failures",
+        ]
+    }
+
     def get(self, path, params):
+        handler = self.ROUTES.get(path)
+        if handler is None:
+            # Default: show API help
+            return self.API_HELP
+        return getattr(self, handler)(params)
+
+    def post(self, path, data):
+        handler = self.POST_ROUTES.get(path)
+        if handler is None:
+            return {"error": "Unknown endpoint"}, 404
+        return getattr(self, handler)(data)
+
+    def _get_index(self, params):
         # Serve web UI at root
-        if path == '/' or path == '/index.html':
-            return self.file('slide/slide.html')
+        return self.file('slide/slide.html')
 
-        if path == '/status':
-            return _controller.slideshow.get_status()
+    def _get_status(self, params):
+        return self.controller.slideshow.get_status()
 
-        if path == '/pause':
-            _controller.execute_action("pause")
-            return {"success": True, "paused": True}
+    def _get_pause(self, params):
+        self.controller.execute_action("pause")
+        return {"success": True, "paused": True}
 
-        if path == '/resume':
-            _controller.execute_action("resume")
-            return {"success": True, "paused": False}
+    def _get_resume(self, params):
+        self.controller.execute_action("resume")
+        return {"success": True, "paused": False}
 
-        if path == '/skip':
-            _controller.execute_action("skip")
-            return {"success": True}
+    def _get_skip(self, params):
+        self.controller.execute_action("skip")
+        return {"success": True}
 
-        if path == '/duration':
-            if 'seconds' in params:
-                seconds = int(params['seconds'])
-                _controller.execute_action("set_duration", {"seconds": seconds})
-                return {"success": True, "duration": seconds}
+    def _get_duration(self, params):
+        seconds = params.get('seconds')
+        if seconds is None:
             return {"error": "Missing 'seconds' parameter"}, 400
+        seconds = int(seconds)
+        self.controller.execute_action("set_duration", {"seconds": seconds})
+        return {"success": True, "duration": seconds}
 
-        if path == '/filter':
-            if 'folder' in params:
-                _controller.execute_action("set_filter", {"folder": params['folder']})
-                return {"success": True, "filter": params['folder']}
+    def _get_filter(self, params):
+        folder = params.get('folder')
+        if folder is None:
             return {"error": "Missing 'folder' parameter"}, 400
+        self.controller.execute_action("set_filter", {"folder": folder})
+        return {"success": True, "filter": folder}
 
-        if path == '/filter/clear':
-            _controller.execute_action("filter_clear")
-            return {"success": True, "filter": None}
-
-        if path == '/monitor/on':
-            _controller.execute_action("monitor_on")
-            return {"success": True, "monitor_on": True}
-
-        if path == '/monitor/off':
-            _controller.execute_action("monitor_off")
-            return {"success": True, "monitor_on": False}
-
-        if path == '/orientation':
-            if 'mode' in params:
-                mode = params['mode']
-                if mode in ('auto', 'landscape', 'portrait_left', 'portrait_right'):
-                    _controller.execute_action("set_orientation", {"mode": mode})
-                    return {"success": True, "orientation": mode}
-                return {"error": "Invalid mode. Use: auto, landscape, portrait_left, portrait_right"}, 400
-            return {"error": "Missing 'mode' parameter"}, 400
-
-        if path == '/restart':
-            return restart_server()
+    def _get_filter_clear(self, params):
+        self.controller.execute_action("filter_clear")
+        return {"success": True, "filter": None}
 
-        if path == '/folders':
-            folders = set()
-            effective_dir = _controller.slideshow.get_effective_image_dir()
-            for root, dirs, _ in os.walk(effective_dir):
-                rel_root = os.path.relpath(root, effective_dir)
-                if rel_root != '.':
-                    folders.add(rel_root)
-                for d in dirs:
-                    folders.add(os.path.join(rel_root, d) if rel_root != '.' else d)
-            return {"folders": sorted(folders)}
+    def _get_monitor_on(self, params):
+        self.controller.execute_action("monitor_on")
+        return {"success": True, "monitor_on": True}
 
-        # Image preparation endpoints
-        if path == '/prepare' or path == '/prepare.html':
-            return self.file('prepare/prepare.html')
-
-        if path == '/api/prepare/status':
-            if _prepare_job:
-                return _prepare_job.get_status()
-            return {"error": "Prepare job not initialized"}, 500
+    def _get_monitor_off(self, params):
+        self.controller.execute_action("monitor_off")
+        return {"success": True, "monitor_on": False}
 
-        if path == '/api/prepare/cancel':
-            if _prepare_job:
-                _prepare_job.cancel()
-                return {"success": True, "message": "Cancellation requested"}
-            return {"error": "Prepare job not initialized"}, 500
-
-        if path == '/api/prepare/count':
-            return self._handle_prepare_count(params)
-
-        if path == '/api/prepare/defaults':
-            return {
-                "input_dir": _controller.slideshow.upload_dir,
-                "output_dir": _controller.slideshow.image_dir,
-                "mode": "hybrid-stretch",
-                "target_size": "1920x1080",
-                "pad_mode": "average",
-                "crop_min": 0.8,
-                "stretch_max": 0.2,
-                "no_stretch_limit": 0.4,
-                "modes": ["pad", "crop", "hybrid", "hybrid-stretch"],
-                "pad_modes": ["gray", "white", "black", "average"],
-            }
-
-        # Default: show API help
-        return {
-            "endpoints": [
-                "GET /status - Current status",
-                "GET /pause - Pause slideshow",
-                "GET /resume - Resume slideshow",
-                "GET /skip - Skip to next image",
-                "GET /duration?seconds=N - Set display duration",
-                "GET /filter?folder=NAME - Show only images from folder",
-                "GET /filter/clear - Clear folder filter",
-                "GET /orientation?mode=MODE - Set orientation (auto, landscape, portrait_left, portrait_right)",
-                "GET /folders - List available folders",
-                "GET /monitor/on - Turn monitor on",
-                "GET /monitor/off - Turn monitor off",
-                "GET /prepare - Image preparation UI",
-                "GET /api/prepare/status - Preparation job status",
-                "POST /api/prepare/start - Start preparation job",
-                "GET /api/prepare/cancel - Cancel running job",
-                "GET /api/update/status - Update system status",
-                "POST /api/update/check - Check for updates on GitHub",
-                "POST /api/update/download - Download and stage update",
-                "POST /api/update/apply - Apply staged update and restart",
-                "POST /api/update/rollback - Rollback to backup version",
-                "POST /api/update/enable - Re-enable updates after failures",
-            ]
-        }
-
-    def post(self, path, data):
-        if path == '/api/prepare/start':
-            return self._handle_prepare_start(data)
-
-        return {"error": "Unknown endpoint"}, 404
+    def _get_orientation(self, params):
+        mode = params.get('mode')
+        if mode is None:
+            return {"error": "Missing 'mode' parameter"}, 400
+        if mode not in _ORIENTATION_MODES:
+            return {"error": "Invalid mode. Use: auto, landscape, portrait_left, portrait_right"}, 400
+        self.controller.execute_action("set_orientation", {"mode": mode})
+        return {"success": True, "orientation": mode}
+
+    def _get_restart(self, params):
+        return restart_server()
+
+    def _get_prepare(self, params):
+        return self.file('prepare/prepare.html')
+
+    def _get_prepare_status(self, params):
+        if self.prepare_job:
+            return self.prepare_job.get_status()
+        return {"error": "Prepare job not initialized"}, 500
+
+    def _get_prepare_cancel(self, params):
+        if self.prepare_job:
+            self.prepare_job.cancel()
+            return {"success": True, "message": "Cancellation requested"}
+        return {"error": "Prepare job not initialized"}, 500
+
+    def _get_prepare_defaults(self, params):
+        return self.controller.prepare_defaults
+
+    def _list_folders(self, params):
+        """Handle /folders, reusing a recent listing while the root is unchanged."""
+        effective_dir = self.controller.slideshow.get_effective_image_dir()
+        try:
+            root_mtime = os.stat(effective_dir).st_mtime_ns
+        except OSError:
+            root_mtime = None
+
+        now = time.monotonic()
+        with _folders_cache_lock:
+            cached = _folders_cache.get(effective_dir)
+            if cached and cached[0] == root_mtime and now < cached[1]:
+                _folders_cache.move_to_end(effective_dir)
+                return cached[2]
+
+        # Every subdirectory is visited exactly once, so no dedup is needed
+        folders = sorted(_iter_subdirs(effective_dir))
+        response = {"folders": folders}
+        with _folders_cache_lock:
+            _folders_cache[effective_dir] = (root_mtime, now + FOLDERS_CACHE_TTL, response)
+            _folders_cache.move_to_end(effective_dir)
+            while len(_folders_cache) > FOLDERS_CACHE_SIZE:
+                _folders_cache.popitem(last=False)
+        return response
 
     def _handle_prepare_count(self, params):
         """Handle /api/prepare/count endpoint."""
-        from aide_frame.paths import resolve_safe_path, PathSecurityError
-        from utils.helpers import get_imgPrepare
 
-        dir_param = params.get('dir', _controller.slideshow.image_dir)
+        dir_param = params.get('dir', self.controller.slideshow.image_dir)
         try:
             directory = resolve_safe_path(dir_param)
         except PathSecurityError as e:
@@ -179,27 +286,23 @@ class SlideshowHandler(JsonHandler):
 
         module = get_imgPrepare()
         if module:
-            from pathlib import Path
-            count = module.count_image_files(Path(directory))
+            count = _cached_count(directory, lambda: module.count_image_files(Path(directory)))
             return {"count": count, "directory": directory}
         return {"error": "imgPrepare not available"}, 500
 
     def _handle_prepare_start(self, data):
         """Handle /api/prepare/start endpoint."""
-        from aide_frame.paths import resolve_safe_path, PathSecurityError
-        from utils.helpers import get_imgPrepare
-        from pathlib import Path as PathLib
 
         module = get_imgPrepare()
         if not module:
             return {"error": "imgPrepare module not available"}, 500
 
-        if not _prepare_job:
+        if not self.prepare_job:
             return {"error": "Prepare job not initialized"}, 500
 
         try:
-            input_dir_str = data.get('input_dir', _controller.slideshow.upload_dir)
-            output_dir_str = data.get('output_dir', _controller.slideshow.image_dir)
+            input_dir_str = data.get('input_dir', self.controller.slideshow.upload_dir)
+            output_dir_str = data.get('output_dir', self.controller.slideshow.image_dir)
 
             try:
                 input_dir = resolve_safe_path(input_dir_str)
@@ -215,8 +318,8 @@ class SlideshowHandler(JsonHandler):
                 target_size = tuple(size_str)
 
             config = module.PrepareConfig(
-                input_dir=PathLib(input_dir),
-                output_dir=PathLib(output_dir),
+                input_dir=Path(input_dir),
+                output_dir=Path(output_dir),
                 mode=data.get('mode', 'hybrid-stretch'),
                 target_size=target_size,
                 pad_mode=data.get('pad_mode', 'average'),
@@ -230,8 +333,13 @@ class SlideshowHandler(JsonHandler):
                 quiet=True,
             )
 
-            success, message = _prepare_job.start(config)
+            success, message = self.prepare_job.start(config)
             if success:
+                # The job creates folders and images in the output directory
+                with _folders_cache_lock:
+                    _folders_cache.clear()
+                with _count_cache_lock:
+                    _count_cache.clear()
                 return {"success": True, "message": message}
             return {"success": False, "error": message}, 409
 
@@ -243,14 +351,28 @@ class HTTPAPIRemoteControl(RemoteControlProvider):
     """HTTP REST API for remote control."""
 
     def __init__(self, config, slideshow, update_config=None, prepare_job=None, platform='unknown', pwa_config=None):
-        global _controller, _prepare_job
         super().__init__(slideshow)
         self.port = config.get("port", 8080)
         self.platform = platform
+        self._server_url = None  # Resolved on first get_server_url() call
+
+        # Served by /api/prepare/defaults; the directories are fixed at startup
+        self.prepare_defaults = {
+            "input_dir": slideshow.upload_dir,
+            "output_dir": slideshow.image_dir,
+            "mode": "hybrid-stretch",
+            "target_size": "1920x1080",
+            "pad_mode": "average",
+            "crop_min": 0.8,
+            "stretch_max": 0.2,
+            "no_stretch_limit": 0.4,
+            "modes": ["pad", "crop", "hybrid", "hybrid-stretch"],
+            "pad_modes": ["gray", "white", "black", "average"],
+        }
 
-        # Set module-level references for handler
-        _controller = self
-        _prepare_job = prepare_job
+        # Set class-level references for handler
+        SlideshowHandler.controller = self
+        SlideshowHandler.prepare_job = prepare_job
 
         # Build DocsConfig with PWA if provided
         docs_config = http_routes.DocsConfig(
@@ -274,8 +396,10 @@ class HTTPAPIRemoteControl(RemoteControlProvider):
         )
 
     def get_server_url(self):
-        """Public method to get server URL."""
-        return get_server_url(self.port, self.platform)
+        """Public method to get server URL (resolved once, the lookup may be slow)."""
+        if self._server_url is None:
+            self._server_url = get_server_url(self.port, self.platform)
+        return self._server_url
 
     def start(self):
         self._server.start()
@@ -21,13 +21,17 @@ Limitations:
 - Need to learn remote codes
 """
 
+import struct
 import threading
-import selectors
 
 from aide_frame.log import logger
 from . import RemoteControlProvider
 
 
+# struct input_event: timeval (two native longs, skipped as padding), type, code, value
+_EVENT_STRUCT = struct.Struct(f"{struct.calcsize('ll')}xHHI")
+
+
 class IRRemoteControl(RemoteControlProvider):
     """IR Remote control using Linux input subsystem."""
 
@@ -49,19 +53,23 @@ class IRRemoteControl(RemoteControlProvider):
         "KEY_RED": 398, "KEY_GREEN": 399, "KEY_YELLOW": 400,
         "KEY_BLUE": 401,
     }
+    _CODE_TO_NAME = {code: name for name, code in KEY_CODES.items()}
 
     def __init__(self, config, slideshow):
         super().__init__(slideshow)
         self.device_path = config.get("device", "/dev/input/event0")
         self.key_map = config.get("key_map", {})
         self.folder_shortcuts = config.get("folder_shortcuts", {})
+        self._dispatch = []  # Handlers indexed by key code, built in start()
         self._running = False
         self._thread = None
         self._device_fd = None
 
     def start(self):
+        self._dispatch = self._build_dispatch()
         try:
-            self._device_fd = open(self.device_path, 'rb')
+            # Unbuffered, so readinto() hands over whole events as they arrive
+            self._device_fd = open(self.device_path, 'rb', buffering=0)
             self._running = True
             self._thread = threading.Thread(target=self._listen_loop, daemon=True)
             self._thread.start()
@@ -80,61 +88,69 @@ class IRRemoteControl(RemoteControlProvider):
 
     def _code_to_name(self, code):
         """Convert key code to key name."""
-        for name, c in self.KEY_CODES.items():
-            if c == code:
-                return name
-        return None
+        return self._CODE_TO_NAME.get(code)
+
+    # Events fetched per read; evdev hands over as many whole events as are queued
+    READ_EVENTS = 16
 
     def _listen_loop(self):
         """Main loop reading input events."""
-        import struct
-
-        EVENT_SIZE = 24
-        EVENT_FORMAT = 'llHHI'
-
-        sel = selectors.DefaultSelector()
-        sel.register(self._device_fd, selectors.EVENT_READ)
+        EVENT_SIZE = _EVENT_STRUCT.size
+        buf = bytearray(EVENT_SIZE * self.READ_EVENTS)  # Reused for every read
+        view = memoryview(buf)
 
+        # The event device blocks until input arrives. Closing the fd in stop()
+        # does not interrupt a read already in progress, so the loop only exits
+        # after the next event; the thread is a daemon, so stop() never joins it
         while self._running:
-            events = sel.select(timeout=1.0)
-            if not events:
-                continue
-
             try:
-                data = self._device_fd.read(EVENT_SIZE)
-                if not data or len(data) < EVENT_SIZE:
+                n = self._device_fd.readinto(buf)
+                if not n or n < EVENT_SIZE:
                     continue
 
-                _, _, ev_type, ev_code, ev_value = struct.unpack(EVENT_FORMAT, data)
-
-                if ev_type == self.EV_KEY and ev_value == self.KEY_PRESS:
-                    key_name = self._code_to_name(ev_code)
-                    if key_name:
-                        self._handle_key(key_name)
-                    else:
-                        logger.debug(f"IR: Unknown key code {ev_code}")
+                # A key press arrives as a batch (scan code, key, sync), read in one go
+                for ev_type, ev_code, ev_value in _EVENT_STRUCT.iter_unpack(view[:n - n % EVENT_SIZE]):
+                    if ev_type == self.EV_KEY and ev_value == self.KEY_PRESS:
+                        dispatch = self._dispatch
+                        handler = dispatch[ev_code] if ev_code < len(dispatch) else None
+                        if handler:
+                            handler()
+                        else:
+                            key_name = self._code_to_name(ev_code) or "unknown key"
+                            logger.debug(f"IR: No action mapped for code {ev_code} ({key_name})")
 
             except Exception as e:
                 if self._running:
                     logger.error(f"IR read error: {e}")
 
-        sel.close()
-
-    def _handle_key(self, key_name):
-        """Handle a key press."""
-        action = self.key_map.get(key_name)
-        if not action:
-            logger.debug(f"IR: No action mapped for {key_name}")
-            return
-
-        logger.info(f"IR: {key_name} -> {action}")
-
-        # Pass folder shortcuts as params for filter actions
-        if action.startswith("filter_") and action != "filter_clear":
-            folder = self.folder_shortcuts.get(action)
-            if folder:
-                self.execute_action("set_filter", {"folder": folder})
-            else:
+    def _build_dispatch(self):
+        """Build a table of handlers indexed by key code, resolving folder shortcuts once.
+
+        Key codes are small integers (< 512), so a dense list is cheaper to
+        index per event than a dict lookup.
+        """
+        handlers = {}
+        for key_name, action in self.key_map.items():
+            code = self.KEY_CODES.get(key_name)
+            if code is None:
+                logger.warning(f"IR: Unknown key name in key_map: {key_name}")
+            elif action:
+                handlers[code] = self._make_handler(key_name, action)
+
+        dispatch = [None] * (max(handlers, default=-1) + 1)
+        for code, handler in handlers.items():
+            dispatch[code] = handler
+        return dispatch
+
+    def _make_handler(self, key_name, action):
+        """Create the handler for one key_map entry."""
+        # Configured folder shortcuts are registered as actions by the base class
+        if action.startswith("filter_") and action != "filter_clear" and not self.folder_shortcuts.get(action):
+            def warn():
                 logger.warning(f"IR: No folder configured for {action}")
-        else:
+            return warn
+
+        def handler():
+            logger.info(f"IR: {key_name} -> {action}")
             self.execute_action(action)
+        return handler
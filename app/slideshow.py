@@ -11,9 +11,11 @@ backends depending on your hardware setup.
 """
 
 import os
+import re
 import sys
 import pygame
 import time
+import queue
 import random
 import signal
 import threading
@@ -83,9 +85,18 @@ from config import DEFAULT_CONFIG
 # 6. APPLICATION CLASS
 # =============================================================================
 
+IMAGE_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg'))  # Lowercase, without the dot
+
+# Only the two /proc/meminfo fields used by get_memory_info (values in kB)
+_MEMINFO_RE = re.compile(rb'^(MemTotal|MemAvailable):\s+(\d+)', re.M)
+
+
 class Slideshow:
     """Main slideshow application with pygame display."""
 
+    # Max time between pygame event checks while waiting (keyboard, window events)
+    EVENT_POLL_INTERVAL = 0.25
+
     def __init__(self, config):
         self.config = config
         self.running = True
@@ -117,14 +128,18 @@ class Slideshow:
         if PLATFORM == 'raspi':
             display_connected = False
             try:
-                # Check DRM connector status
+                # Check DRM connector status (connectors are named like card0-HDMI-A-1;
+                # card0, renderD128 and version have no status file)
                 for connector in os.listdir('/sys/class/drm/'):
-                    status_file = f'/sys/class/drm/{connector}/status'
-                    if os.path.exists(status_file):
-                        with open(status_file) as f:
+                    if '-' not in connector:
+                        continue
+                    try:
+                        with open(f'/sys/class/drm/{connector}/status') as f:
                             if f.read().strip() == 'connected':
                                 display_connected = True
                                 break
+                    except OSError:
+                        continue
             except Exception:
                 pass
             if not display_connected:
@@ -134,7 +149,7 @@ class Slideshow:
 
         # Initialize pygame display (disable audio on WSL2 to avoid ALSA errors)
         if PLATFORM == 'wsl2':
-            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')  # Honor a user-set driver
         pygame.display.init()
         pygame.init()
 
@@ -160,6 +175,11 @@ class Slideshow:
             )
             logger.info(f"Running in windowed mode: {width}x{height}")
 
+        # Only queue the events _handle_pygame_events acts on; SDL drops the
+        # rest (mouse motion etc.) before they ever reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE])
+
         # WSLg/Wayland workaround: force window to render immediately
         # Without this, the window may stay black for ~20 seconds under WSLg
         self.screen.fill((0, 0, 0))
@@ -168,16 +188,21 @@ class Slideshow:
 
         self.width, self.height = self.screen.get_size()
         self.clock = pygame.time.Clock()
-        self.fade_surface = pygame.Surface((self.width, self.height)).convert()
-        self.fade_surface.fill((0, 0, 0))
 
         self.playlist = []
+        self._order = []  # Shuffled indices into self.playlist, consumed from the end
+        self._playlist_generation = 0  # Bumped whenever the playlist is invalidated
+        self._preloaded = queue.Queue(maxsize=1)  # (generation, path, surface) of the next image
+        self._scan_cache = {}  # (directory, filter, orientation) -> (dir mtimes, images)
+        self._mem_cache = (0.0, None)  # (monotonic timestamp, get_memory_info result)
+        self._effective_dir = None  # Directory the last get_images() call used
         self.current_img = None
         self.current_path = None
         self._skip_requested = False
         self._pending_resize = False
 
         self.lock = threading.Lock()
+        self._wake = threading.Event()  # Set by skip/pause/resume/filter changes to end a wait early
 
         signal.signal(signal.SIGTERM, self.handle_exit_signal)
         signal.signal(signal.SIGINT, self.handle_exit_signal)
@@ -185,49 +210,92 @@ class Slideshow:
     def handle_exit_signal(self, signum, frame):
         logger.info("Shutdown signal received. Stopping slideshow...")
         self.running = False
+        self._wake.set()
         pygame.quit()
         sys.exit(0)
 
     def get_effective_image_dir(self):
         """Get the directory currently being used for images (may be sample_images fallback)."""
-        if self._scan_directory(self.image_dir):
-            return self.image_dir
-        sample_dir = os.path.join(SCRIPT_DIR, "sample_images")
-        if os.path.isdir(sample_dir) and self._scan_directory(sample_dir):
-            return sample_dir
-        return self.image_dir
+        if self._effective_dir is None:
+            self.get_images()
+        return self._effective_dir
 
     def get_images(self):
         """Get images, optionally filtered by folder. Falls back to sample_images if empty."""
         images = self._scan_directory(self.image_dir)
+        effective_dir = self.image_dir
 
         # Fallback to sample_images if configured directory is empty or missing
         if not images:
             sample_dir = os.path.join(SCRIPT_DIR, "sample_images")
             if os.path.isdir(sample_dir):
                 images = self._scan_directory(sample_dir)
+                if images:
+                    effective_dir = sample_dir
                 if images and not hasattr(self, '_sample_warning_shown'):
                     logger.info(f"Using sample images from {sample_dir}")
                     logger.info("Configure image_dir in config.json to use your own photos")
                     self._sample_warning_shown = True
 
+        self._effective_dir = effective_dir
         return images
 
     def _scan_directory(self, directory):
-        """Scan a directory recursively for images, filtered by orientation."""
+        """Scan a directory recursively for images, filtered by orientation.
+
+        Results are cached per (directory, filter, orientation). Adding or removing
+        a file or subfolder changes the mtime of its parent directory, so the cache
+        stays valid as long as every directory seen during the scan is unchanged.
+        The returned list is the cached one and must not be modified.
+        """
+        key = (directory, self.current_filter, self.orientation)
+        cached = self._scan_cache.get(key)
+        if cached and self._dirs_unchanged(cached[0]):
+            return cached[1]
+
         images = []
         if not os.path.isdir(directory):
             return images
-        for root, _, files in os.walk(directory):
-            if self.current_filter and self.current_filter not in root:
-                continue
-            for f in files:
-                if f.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    path = os.path.join(root, f)
-                    if self._matches_orientation(path):
-                        images.append(path)
+        dir_mtimes = {}
+        self._scan_tree(directory, self.current_filter, images, dir_mtimes)
+        self._scan_cache[key] = (dir_mtimes, images)
         return images
 
+    def _scan_tree(self, path, folder_filter, images, dir_mtimes):
+        """Collect images below path into images, recording directory mtimes.
+
+        The filter matches anywhere in the directory path, so once a directory
+        matches, all of its descendants do too and the check is dropped.
+        """
+        if folder_filter and folder_filter in path:
+            folder_filter = None
+        try:
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                self._scan_tree(entry.path, folder_filter, images, dir_mtimes)
+            elif (not folder_filter
+                    and '.' in entry.name
+                    and entry.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS
+                    and entry.is_file()
+                    and self._matches_orientation(entry.path)):
+                images.append(entry.path)
+
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes):
+        """Check that none of the given directories was modified since the scan."""
+        for path, mtime in dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
     def _matches_orientation(self, path):
         """Check if image matches current orientation filter (reads only header)."""
         if self.orientation == 'auto':
@@ -245,38 +313,47 @@ class Slideshow:
             return True  # Include on error
 
     def fade_transition(self, next_img):
+        """Fade in next_img from black.
+
+        Every frame is drawn from scratch: black, then next_img blended with
+        a surface alpha of k/steps, so no rounding carries over between frames.
+        """
         steps = self.fade_steps
-        for i in range(steps, -1, -1):
-            alpha = int((i / steps) * 255)
+        if steps <= 0:
             self.screen.blit(next_img, (0, 0))
-            self.fade_surface.set_alpha(alpha)
-            self.screen.blit(self.fade_surface, (0, 0))
+            pygame.display.flip()
+            return
+        for k in range(steps + 1):
+            self.screen.fill((0, 0, 0))
+            if k:
+                next_img.set_alpha(round(255 * k / steps))
+                self.screen.blit(next_img, (0, 0))
             pygame.display.flip()
             self.clock.tick(30)
+        next_img.set_alpha(None)
 
     def get_memory_info(self):
-        """Get memory usage information."""
+        """Get memory usage information (cached for a second, status is polled)."""
+        now = time.monotonic()
+        cached_at, cached = self._mem_cache
+        if cached and now - cached_at < 1.0:
+            return cached
         try:
-            with open('/proc/meminfo', 'r') as f:
-                meminfo = {}
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        key = parts[0].rstrip(':')
-                        value = int(parts[1])  # in kB
-                        meminfo[key] = value
-
-                total = meminfo.get('MemTotal', 0)
-                available = meminfo.get('MemAvailable', 0)
-                used = total - available
-                return {
-                    "total_mb": round(total / 1024),
-                    "used_mb": round(used / 1024),
-                    "available_mb": round(available / 1024),
-                    "percent_used": round(used / total * 100) if total > 0 else 0
-                }
-        except:
+            with open('/proc/meminfo', 'rb') as f:
+                meminfo = dict(_MEMINFO_RE.findall(f.read()))
+            total = int(meminfo.get(b'MemTotal', 0))
+            available = int(meminfo.get(b'MemAvailable', 0))
+        except (OSError, ValueError):
             return None
+        used = total - available
+        info = {
+            "total_mb": round(total / 1024),
+            "used_mb": round(used / 1024),
+            "available_mb": round(available / 1024),
+            "percent_used": round(used / total * 100) if total > 0 else 0
+        }
+        self._mem_cache = (now, info)  # Tuple assignment is atomic, no lock needed
+        return info
 
     def get_status(self):
         with self.lock:
@@ -288,7 +365,7 @@ class Slideshow:
                 "current_image": self.current_path,
                 "filter": self.current_filter,
                 "orientation": self.orientation,
-                "playlist_size": len(self.playlist)
+                "playlist_size": len(self._order)
             }
             mem = self.get_memory_info()
             if mem:
@@ -300,18 +377,30 @@ class Slideshow:
             self.display_duration = max(1, min(300, seconds))
             logger.info(f"Display duration set to {self.display_duration}s")
 
+    def _invalidate_playlist(self):
+        """Drop the playlist and any preloaded image. Caller must hold self.lock."""
+        self.playlist = []
+        self._order = []
+        self._playlist_generation += 1
+        try:
+            self._preloaded.get_nowait()
+        except queue.Empty:
+            pass
+
     def set_filter(self, folder_filter):
         with self.lock:
             self.current_filter = folder_filter
-            self.playlist = []
+            self._invalidate_playlist()
             self._skip_requested = True  # Show image from new folder immediately
+            self._wake.set()
             logger.info(f"Filter set to: {folder_filter}")
 
     def clear_filter(self):
         with self.lock:
             self.current_filter = None
-            self.playlist = []
+            self._invalidate_playlist()
             self._skip_requested = True  # Show image immediately
+            self._wake.set()
             logger.info("Filter cleared")
 
     def set_orientation(self, orientation):
@@ -323,8 +412,9 @@ class Slideshow:
                 return
             old_orientation = self.orientation
             self.orientation = orientation
-            self.playlist = []  # Force reload with new filter
+            self._invalidate_playlist()  # Force reload with new filter
             self._skip_requested = True  # Show next image immediately with new orientation
+            self._wake.set()
             logger.info(f"Orientation set to: {orientation}")
 
             # WSL2/windowed mode: flag for resize (must happen in main thread)
@@ -337,16 +427,19 @@ class Slideshow:
     def pause(self):
         with self.lock:
             self.paused = True
+            self._wake.set()
             logger.info("Slideshow paused")
 
     def resume(self):
         with self.lock:
             self.paused = False
+            self._wake.set()
             logger.info("Slideshow resumed")
 
     def skip(self):
         with self.lock:
             self._skip_requested = True
+            self._wake.set()
             logger.info("Skipping to next image")
 
     def _handle_pygame_events(self):
@@ -359,8 +452,6 @@ class Slideshow:
                 (self.width, self.height),
                 pygame.DOUBLEBUF | pygame.RESIZABLE
             )
-            self.fade_surface = pygame.Surface((self.width, self.height)).convert()
-            self.fade_surface.fill((0, 0, 0))
             self.current_img = None  # Force reload at new size
             logger.debug(f"Window resized to {self.width}x{self.height}")
 
@@ -391,8 +482,6 @@ class Slideshow:
                     (self.width, self.height),
                     pygame.DOUBLEBUF | pygame.RESIZABLE
                 )
-                self.fade_surface = pygame.Surface((self.width, self.height)).convert()
-                self.fade_surface.fill((0, 0, 0))
                 # Rescale current image if we have one
                 if self.current_img:
                     self.current_img = pygame.transform.scale(
@@ -413,8 +502,8 @@ class Slideshow:
             return
 
         try:
-            img = pygame.image.load(welcome_path)
-            img = pygame.transform.scale(img, (self.width, self.height)).convert()
+            img = pygame.image.load(welcome_path).convert()
+            img = pygame.transform.scale(img, (self.width, self.height))
         except Exception as e:
             logger.error(f"Error loading welcome image: {e}")
             return
@@ -426,13 +515,76 @@ class Slideshow:
         logger.info(f"Showing welcome screen for {duration}s - {url}")
 
         # Wait for duration, but stay responsive
-        elapsed = 0
-        while elapsed < duration and self.running:
+        deadline = time.monotonic() + duration
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             self._handle_pygame_events()
-            time.sleep(0.1)
-            elapsed += 0.1
+            if self._wake.wait(min(self.EVENT_POLL_INTERVAL, remaining)):
+                self._wake.clear()
+
+    def _load_image(self, path):
+        """Load an image and fit it to the screen. Returns None on error.
+
+        Runs on the preload thread, so the result is left in its file's pixel
+        format; convert() depends on the display and is done by the main loop.
+        """
+        try:
+            img = pygame.image.load(path)
+
+            # Portrait mode on fullscreen: rotate image to match physical monitor orientation
+            # KMSDRM (Raspi) can't resize window, so we rotate the image instead
+            # Scale to swapped dimensions (height x width), then rotate for monitor orientation
+            if self.orientation.startswith('portrait') and self.video_config.get('fullscreen', True):
+                img = pygame.transform.scale(img, (self.height, self.width))
+                # portrait_left: monitor rotated CCW, rotate image CW (+90)
+                # portrait_right: monitor rotated CW, rotate image CCW (-90)
+                angle = 90 if self.orientation == 'portrait_left' else -90
+                return pygame.transform.rotate(img, angle)
+            return pygame.transform.scale(img, (self.width, self.height))
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return None
+
+    def _preload_loop(self):
+        """Background thread: decode and scale the next image while the current one is shown."""
+        while self.running:
+            with self.lock:
+                generation = self._playlist_generation
+                path = self.playlist[self._order.pop()] if self._order else None
+
+            if path is None:
+                images = self.get_images()
+                if not images:
+                    logger.warning("No images found, waiting...")
+                    time.sleep(5)
+                    continue
+                # Shuffle indices rather than the (cached) path list itself
+                order = list(range(len(images)))
+                random.shuffle(order)
+                with self.lock:
+                    if generation == self._playlist_generation:
+                        self.playlist = images
+                        self._order = order
+                continue
+
+            img = self._load_image(path)
+            if img is None:
+                continue
+
+            # Blocks until the main loop takes the previous image
+            while self.running and generation == self._playlist_generation:
+                try:
+                    self._preloaded.put((generation, path, img), timeout=0.5)
+                    break
+                except queue.Full:
+                    pass
 
     def run(self, server_url=None):
+        # Start preparing the first image while the welcome screen is shown
+        threading.Thread(target=self._preload_loop, daemon=True).start()
+
         # Show welcome screen first if we have a server URL
         if server_url:
             self.show_welcome_screen(server_url)
@@ -442,37 +594,22 @@ class Slideshow:
             self._handle_pygame_events()
 
             if self.paused:
-                time.sleep(0.1)
+                self._wake.wait(self.EVENT_POLL_INTERVAL)
+                self._wake.clear()
                 continue
 
-            if not self.playlist:
-                self.playlist = self.get_images()
-                if not self.playlist:
-                    logger.warning("No images found, waiting...")
-                    time.sleep(5)
-                    continue
-                random.shuffle(self.playlist)
-
-            path = self.playlist.pop(0)
-            self.current_path = path
-
             try:
-                img = pygame.image.load(path)
-
-                # Portrait mode on fullscreen: rotate image to match physical monitor orientation
-                # KMSDRM (Raspi) can't resize window, so we rotate the image instead
-                # Scale to swapped dimensions (height x width), then rotate for monitor orientation
-                if self.orientation.startswith('portrait') and self.video_config.get('fullscreen', True):
-                    img = pygame.transform.scale(img, (self.height, self.width))
-                    # portrait_left: monitor rotated CCW, rotate image CW (+90)
-                    # portrait_right: monitor rotated CW, rotate image CCW (-90)
-                    angle = 90 if self.orientation == 'portrait_left' else -90
-                    img = pygame.transform.rotate(img, angle).convert()
-                else:
-                    img = pygame.transform.scale(img, (self.width, self.height)).convert()
-            except Exception as e:
-                logger.error(f"Error loading {path}: {e}")
+                generation, path, img = self._preloaded.get(timeout=self.EVENT_POLL_INTERVAL)
+            except queue.Empty:
                 continue
+            if generation != self._playlist_generation:
+                continue  # Filter or orientation changed while it was loading
+            # Display format conversion stays on this thread: set_mode and quit
+            # replace or destroy the display surface it depends on
+            img = img.convert()
+            if img.get_size() != (self.width, self.height):
+                img = pygame.transform.scale(img, (self.width, self.height))  # Window was resized
+            self.current_path = path
 
             if self.current_img is None:
                 self.screen.blit(img, (0, 0))
@@ -484,14 +621,22 @@ class Slideshow:
             self.current_img = img
 
             self._skip_requested = False
-            elapsed = 0
-            while elapsed < self.display_duration and self.running and not self._skip_requested:
+            self._wake.clear()
+            shown_at = time.monotonic()
+            while self.running and not self._skip_requested:
                 self._handle_pygame_events()  # Keep processing events during display
                 if self.paused:
-                    time.sleep(0.1)
+                    paused_at = time.monotonic()
+                    self._wake.wait(self.EVENT_POLL_INTERVAL)
+                    self._wake.clear()
+                    shown_at += time.monotonic() - paused_at  # Paused time doesn't count
                     continue
-                time.sleep(0.1)
-                elapsed += 0.1
+                # Re-read display_duration so a changed duration applies to the current image
+                remaining = shown_at + self.display_duration - time.monotonic()
+                if remaining <= 0:
+                    break
+                if self._wake.wait(min(self.EVENT_POLL_INTERVAL, remaining)):
+                    self._wake.clear()  # Skip, pause or resume: re-check state right away
 
 
 # =============================================================================
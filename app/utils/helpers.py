@@ -7,6 +7,8 @@ Contains:
 """
 
 import os
+import time
+import queue
 import threading
 
 from aide_frame import paths
@@ -170,17 +172,27 @@ def get_imgPrepare():
 class ImagePrepareJob:
     """Manages a background image preparation job."""
 
+    # Minimum interval between progress publications to status readers (seconds)
+    PUBLISH_INTERVAL = 0.1
+
+    # Images prepared at once; kept low so the slideshow stays responsive on a Pi
+    WORKERS = 2
+
     def __init__(self):
         self.running = False
         self.cancelled = False
         self.progress = None  # Current PrepareProgress
         self.counts = {"processed": 0, "exists": 0, "error": 0}
         self.error = None
-        self._thread = None
-        self._lock = threading.Lock()
+        self._thread = None  # Persistent worker, started with the first job
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()  # Serializes writers; readers never take it
+        self._status = None  # Status snapshot, replaced (never modified) on every state change
+        with self._lock:
+            self._publish()
 
     def start(self, config):
-        """Start processing in background thread."""
+        """Start processing in the background worker thread."""
         if self.running:
             return False, "Job already running"
 
@@ -188,61 +200,104 @@ class ImagePrepareJob:
         if module is None:
             return False, "imgPrepare module not available"
 
-        self.running = True
-        self.cancelled = False
-        self.progress = None
-        self.counts = {"processed": 0, "exists": 0, "error": 0}
-        self.error = None
-
-        self._thread = threading.Thread(target=self._run, args=(module, config), daemon=True)
-        self._thread.start()
+        with self._lock:
+            # Checked again under the lock so two concurrent requests cannot both start
+            if self.running:
+                return False, "Job already running"
+            self.running = True
+            self.cancelled = False
+            self.progress = None
+            self.counts = {"processed": 0, "exists": 0, "error": 0}
+            self.error = None
+            self._publish()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, daemon=True)
+                self._thread.start()
+
+        self._jobs.put((module, config))
         return True, "Job started"
 
+    def _worker(self):
+        """Background thread running queued jobs one after another."""
+        while True:
+            module, config = self._jobs.get()
+            self._run(module, config)
+
     def _run(self, module, config):
         """Background processing loop."""
+        # Count locally and publish at most every PUBLISH_INTERVAL, so fast runs
+        # (mostly skipped files) do not contend with status polls per image
+        counts = dict(self.counts)
+        last_counted = None  # Last progress included in counts
+        last_publish = time.monotonic()
+        gen = None
         try:
-            gen = module.process_folder_iter(config)
+            gen = module.process_folder_parallel(config, workers=self.WORKERS)
             for progress in gen:
                 if self.cancelled:
                     break
-                with self._lock:
-                    self.progress = progress
-                    self.counts[progress.status] = self.counts.get(progress.status, 0) + 1
+                counts[progress.status] = counts.get(progress.status, 0) + 1
+                last_counted = progress
+                now = time.monotonic()
+                if now - last_publish >= self.PUBLISH_INTERVAL:
+                    last_publish = now
+                    with self._lock:
+                        self.progress = progress
+                        self.counts = dict(counts)
+                        self._publish()
         except Exception as e:
             self.error = str(e)
             logger.error(f"ImagePrepareJob error: {e}")
         finally:
-            self.running = False
+            # Wait for in-flight images before reporting the job as stopped
+            if gen is not None:
+                gen.close()
+            with self._lock:
+                if last_counted is not None:
+                    self.progress = last_counted
+                self.counts = counts
+                self.running = False
+                self._publish()
 
     def cancel(self):
         """Request cancellation of running job."""
-        self.cancelled = True
+        with self._lock:
+            self.cancelled = True
+            self._publish()
 
     def get_status(self):
-        """Get current job status."""
-        with self._lock:
-            if self.progress:
-                return {
-                    "running": self.running,
-                    "cancelled": self.cancelled,
-                    "current": self.progress.current,
-                    "total": self.progress.total,
-                    "percent": round(100 * self.progress.current / self.progress.total, 1) if self.progress.total > 0 else 0,
-                    "current_file": self.progress.filepath,
-                    "counts": self.counts.copy(),
-                    "error": self.error,
-                }
-            else:
-                return {
-                    "running": self.running,
-                    "cancelled": self.cancelled,
-                    "current": 0,
-                    "total": 0,
-                    "percent": 0,
-                    "current_file": None,
-                    "counts": self.counts.copy(),
-                    "error": self.error,
-                }
+        """Get current job status.
+
+        Returns the last published snapshot without locking (a single
+        attribute read); callers must not modify it.
+        """
+        return self._status
+
+    def _publish(self):
+        """Replace the status snapshot from the current state. Caller must hold self._lock."""
+        if self.progress:
+            self._status = {
+                "running": self.running,
+                "cancelled": self.cancelled,
+                "current": self.progress.current,
+                "total": self.progress.total,
+                "percent": round(100 * self.progress.current / self.progress.total, 1) if self.progress.total > 0 else 0,
+                "current_file": self.progress.filepath,
+                "counts": self.counts.copy(),
+                "error": self.error,
+            }
+        else:
+            self._status = {
+                "running": self.running,
+                "cancelled": self.cancelled,
+                "current": 0,
+                "total": 0,
+                "percent": 0,
+                "current_file": None,
+                "counts": self.counts.copy(),
+                "error": self.error,
+            }
 
 
 # Global job instance (only one job at a time)